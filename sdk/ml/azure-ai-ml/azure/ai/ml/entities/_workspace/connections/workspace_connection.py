@@ -4,10 +4,11 @@
 
 # pylint: disable=protected-access
 
-import json
+import copy
+import functools
 from os import PathLike
 from pathlib import Path
-from typing import IO, Any, AnyStr, Dict, Union
+from typing import IO, Any, AnyStr, Callable, Dict, Union
 
 from azure.ai.ml._restclient.v2022_01_01_preview.models import (
     ConnectionAuthType,
@@ -36,6 +37,42 @@ from azure.ai.ml.entities._workspace.connections.credentials import (
     WorkspaceConnectionCredentials,
 )
 
+# Dumping never mutates the schema context, so a single instance can be shared across calls.
+# Loading cannot share one: PathAwareSchema pops params overrides from, and rebases paths in, its context.
+_DEFAULT_DUMP_SCHEMA = WorkspaceConnectionSchema(context={BASE_PATH_CONTEXT_KEY: "./"})
+
+_DEFAULT_BASE_PATH = Path("./")
+
+# Connection categories come from a small fixed vocabulary, so the case conversions are memoized.
+_snake_to_camel_cached = functools.lru_cache(maxsize=64)(_snake_to_camel)
+_camel_to_snake_cached = functools.lru_cache(maxsize=64)(camel_to_snake)
+
+_AUTH_TYPE_TO_CREDENTIALS_BUILDER: Dict[str, Callable[[Any], WorkspaceConnectionCredentials]] = {
+    ConnectionAuthType.PAT: lambda cred: PatTokenCredentials(pat=getattr(cred, "pat", None)),
+    ConnectionAuthType.SAS: lambda cred: SasTokenCredentials(sas=getattr(cred, "sas", None)),
+    ConnectionAuthType.MANAGED_IDENTITY: lambda cred: ManagedIdentityCredentials(
+        client_id=getattr(cred, "client_id", None),
+        resource_id=getattr(cred, "resource_id", None),
+    ),
+    ConnectionAuthType.USERNAME_PASSWORD: lambda cred: UsernamePasswordCredentials(
+        username=getattr(cred, "username", None),
+        password=getattr(cred, "password", None),
+    ),
+    ConnectionAuthType.SERVICE_PRINCIPAL: lambda cred: ServicePrincipalCredentials(
+        client_id=getattr(cred, "client_id", None),
+        client_secret=getattr(cred, "client_secret", None),
+        tenant_id=getattr(cred, "tenant_id", None),
+    ),
+}
+
+_AUTH_TYPE_TO_PROPERTIES_CLASS = {
+    ConnectionAuthType.PAT: PATAuthTypeWorkspaceConnectionProperties,
+    ConnectionAuthType.MANAGED_IDENTITY: ManagedIdentityAuthTypeWorkspaceConnectionProperties,
+    ConnectionAuthType.USERNAME_PASSWORD: UsernamePasswordAuthTypeWorkspaceConnectionProperties,
+    ConnectionAuthType.SAS: SASAuthTypeWorkspaceConnectionProperties,
+    ConnectionAuthType.SERVICE_PRINCIPAL: ServicePrincipalAuthTypeWorkspaceConnectionProperties,
+}
+
 
 class WorkspaceConnection(Resource):
     """Azure ML workspace connection provides a secure way to store
@@ -52,6 +89,8 @@ class WorkspaceConnection(Resource):
     :param type: The category of external resource for this connection.
     :type type: The type of workspace connection, possible values are:
         ["git", "python_feed", "container_registry", "feature_store"]
+    :param metadata: Metadata dictionary, copied on construction.
+    :type metadata: Dict[str, Any]
     """
 
     def __init__(
@@ -73,7 +112,7 @@ class WorkspaceConnection(Resource):
         self.type = type
         self._target = target
         self._credentials = credentials
-        self._metadata = json.loads(json.dumps(metadata))
+        self._metadata = copy.deepcopy(metadata)
         super().__init__(**kwargs)
 
     @property
@@ -90,7 +129,7 @@ class WorkspaceConnection(Resource):
     def type(self, value: str):
         if not value:
             return
-        self._type = _snake_to_camel(value)
+        self._type = _snake_to_camel_cached(value)
 
     @property
     def target(self) -> str:
@@ -131,8 +170,7 @@ class WorkspaceConnection(Resource):
         :type dest: Union[PathLike, str, IO[AnyStr]]
         """
         path = kwargs.pop("path", None)
-        yaml_serialized = self._to_dict()
-        dump_yaml_to_file(dest, yaml_serialized, default_flow_style=False, path=path, **kwargs)
+        dump_yaml_to_file(dest, self._to_dict(), default_flow_style=False, path=path, **kwargs)
 
     @classmethod
     def _load(
@@ -145,7 +183,7 @@ class WorkspaceConnection(Resource):
         data = data or {}
         params_override = params_override or []
         context = {
-            BASE_PATH_CONTEXT_KEY: Path(yaml_path).parent if yaml_path else Path("./"),
+            BASE_PATH_CONTEXT_KEY: Path(yaml_path).parent if yaml_path else _DEFAULT_BASE_PATH,
             PARAMS_OVERRIDE_KEY: params_override,
         }
         return cls._load_from_dict(data=data, context=context, **kwargs)
@@ -157,7 +195,7 @@ class WorkspaceConnection(Resource):
 
     def _to_dict(self) -> Dict:
         # pylint: disable=no-member
-        return WorkspaceConnectionSchema(context={BASE_PATH_CONTEXT_KEY: "./"}).dump(self)
+        return _DEFAULT_DUMP_SCHEMA.dump(self)
 
     @classmethod
     def _from_rest_object(cls, rest_obj: RestWorkspaceConnection) -> "WorkspaceConnection":
@@ -165,35 +203,15 @@ class WorkspaceConnection(Resource):
             return None
 
         properties = rest_obj.properties
-
-        if properties.auth_type == ConnectionAuthType.PAT:
-            credentials = PatTokenCredentials(pat=properties.credential.pat if properties.credentials else None)
-        if properties.auth_type == ConnectionAuthType.SAS:
-            credentials = SasTokenCredentials(sas=properties.credential.sas if properties.credentials else None)
-        if properties.auth_type == ConnectionAuthType.MANAGED_IDENTITY:
-            credentials = ManagedIdentityCredentials(
-                client_id=properties.credential.client_id if properties.credentials else None,
-                resource_id=properties.credential.resource_id if properties.credentials else None,
-            )
-        if properties.auth_type == ConnectionAuthType.USERNAME_PASSWORD:
-            credentials = UsernamePasswordCredentials(
-                username=properties.credential.username if properties.credentials else None,
-                password=properties.credential.password if properties.credentials else None,
-            )
-
-        if properties.auth_type == ConnectionAuthType.SERVICE_PRINCIPAL:
-            credentials = ServicePrincipalCredentials(
-                client_id=properties.credential.client_id if properties.credentials else None,
-                client_secret=properties.credential.client_secret if properties.credentials else None,
-                tenant_id=properties.credential.tenant_id if properties.credentials else None,
-            )
+        credentials_builder = _AUTH_TYPE_TO_CREDENTIALS_BUILDER.get(properties.auth_type)
+        credentials = credentials_builder(properties.credentials) if credentials_builder else None
 
         workspace_connection = WorkspaceConnection(
             id=rest_obj.id,
             name=rest_obj.name,
             target=properties.target,
             creation_context=SystemData._from_rest_object(rest_obj.system_data) if rest_obj.system_data else None,
-            type=camel_to_snake(properties.category),
+            type=_camel_to_snake_cached(properties.category),
             credentials=credentials,
             metadata=properties.metadata,
         )
@@ -204,28 +222,22 @@ class WorkspaceConnection(Resource):
         return self.name
 
     def _to_rest_object(self) -> RestWorkspaceConnection:
-        workspace_connection_properties_class = None
-        auth_type = self.credentials.type if self._credentials else None
-
-        if auth_type == ConnectionAuthType.PAT:
-            workspace_connection_properties_class = PATAuthTypeWorkspaceConnectionProperties
-        elif auth_type == ConnectionAuthType.MANAGED_IDENTITY:
-            workspace_connection_properties_class = ManagedIdentityAuthTypeWorkspaceConnectionProperties
-        elif auth_type == ConnectionAuthType.USERNAME_PASSWORD:
-            workspace_connection_properties_class = UsernamePasswordAuthTypeWorkspaceConnectionProperties
-        elif auth_type == ConnectionAuthType.SAS:
-            workspace_connection_properties_class = SASAuthTypeWorkspaceConnectionProperties
-        elif auth_type == ConnectionAuthType.SERVICE_PRINCIPAL:
-            workspace_connection_properties_class = ServicePrincipalAuthTypeWorkspaceConnectionProperties
-        elif auth_type is None:
-            workspace_connection_properties_class = NoneAuthTypeWorkspaceConnectionProperties
-
-        properties = workspace_connection_properties_class(
-            target=self.target,
-            credentials=self.credentials._to_rest_object(),
-            metadata=self.metadata,
+        credentials = self._credentials
+        if credentials is None:
+            properties = NoneAuthTypeWorkspaceConnectionProperties(
+                target=self._target,
+                metadata=self._metadata,
+                category=self._type,
+            )
+            return RestWorkspaceConnection(properties=properties)
+
+        auth_type = credentials.type
+        properties = _AUTH_TYPE_TO_PROPERTIES_CLASS[auth_type](
+            target=self._target,
+            credentials=credentials._to_rest_object(),
+            metadata=self._metadata,
             auth_type=auth_type,
-            category=_snake_to_camel(self.type),
+            category=self._type,
         )
 
         return RestWorkspaceConnection(properties=properties)
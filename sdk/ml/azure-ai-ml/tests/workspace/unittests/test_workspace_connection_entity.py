@@ -2,7 +2,16 @@ import pytest
 from test_utilities.utils import verify_entity_load_and_dump
 
 from azure.ai.ml import load_workspace_connection
-from azure.ai.ml._restclient.v2022_01_01_preview.models import ConnectionAuthType, ConnectionCategory
+from azure.ai.ml._restclient.v2022_01_01_preview.models import (
+    ConnectionAuthType,
+    ConnectionCategory,
+    NoneAuthTypeWorkspaceConnectionProperties,
+    PATAuthTypeWorkspaceConnectionProperties,
+    PersonalAccessToken,
+)
+from azure.ai.ml._restclient.v2022_01_01_preview.models import (
+    WorkspaceConnectionPropertiesV2BasicResource as RestWorkspaceConnection,
+)
 from azure.ai.ml.entities import WorkspaceConnection
 from azure.ai.ml.entities._workspace.connections.credentials import PatTokenCredentials
 
@@ -79,3 +88,41 @@ class TestWorkspaceConnectionEntity:
         assert ws_connection.metadata["type"] == "feast"
         assert ws_connection.metadata["featurestore_config"]
         assert ws_connection.metadata["connection_config"]
+
+    def test_workspace_connection_from_rest_object(self):
+        rest_obj = RestWorkspaceConnection(
+            properties=PATAuthTypeWorkspaceConnectionProperties(
+                category="PythonFeed",
+                target="https://test-feed.com",
+                credentials=PersonalAccessToken(pat="dummy_pat"),
+            )
+        )
+        ws_connection = WorkspaceConnection._from_rest_object(rest_obj)
+
+        assert ws_connection.type == ConnectionCategory.PYTHON_FEED
+        assert ws_connection.target == "https://test-feed.com"
+        assert ws_connection.credentials.type == ConnectionAuthType.PAT
+        assert ws_connection.credentials.pat == "dummy_pat"
+
+        rest_obj = RestWorkspaceConnection(
+            properties=NoneAuthTypeWorkspaceConnectionProperties(category="Git", target="https://test-git-feed.com")
+        )
+        ws_connection = WorkspaceConnection._from_rest_object(rest_obj)
+
+        assert ws_connection.type == ConnectionCategory.GIT
+        assert ws_connection.credentials is None
+
+    def test_workspace_connection_to_rest_object_without_credentials(self):
+        ws_connection = WorkspaceConnection(
+            target="https://test-git-feed.com",
+            type="git",
+            credentials=None,
+            name="dummy_connection",
+            metadata={"key": "value"},
+        )
+        rest_obj = ws_connection._to_rest_object()
+
+        assert isinstance(rest_obj.properties, NoneAuthTypeWorkspaceConnectionProperties)
+        assert rest_obj.properties.category == ConnectionCategory.GIT
+        assert rest_obj.properties.target == "https://test-git-feed.com"
+        assert rest_obj.properties.metadata == {"key": "value"}
@@ -6,9 +6,117 @@
 
 Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python/customize
 """
-from typing import List
+import asyncio
+from typing import Any, Dict, Iterable, List, Mapping, Union
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from azure.core.tracing.decorator_async import distributed_trace_async
+
+from ... import models as _models
+from ._server_trust_certificates_operations import (
+    ServerTrustCertificatesOperations as _ServerTrustCertificatesOperations,
+)
+
+
+class ServerTrustCertificatesOperations(_ServerTrustCertificatesOperations):
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~azure.mgmt.sql.aio.SqlManagementClient`'s
+        :attr:`server_trust_certificates` attribute.
+    """
+
+    @distributed_trace_async
+    async def bulk_create_or_update(
+        self,
+        resource_group_name: str,
+        managed_instance_name: str,
+        certificates: Mapping[str, _models.ServerTrustCertificate],
+        *,
+        max_concurrency: int = 16,
+        **kwargs: Any
+    ) -> Dict[str, Union[_models.ServerTrustCertificate, Exception]]:
+        """Uploads several server trust certificates to Sql Managed Instance concurrently.
+
+        Each certificate is uploaded with its own long running operation, at most ``max_concurrency``
+        at a time. Operations are not ordered relative to each other, and a failure does not cancel
+        the remaining uploads.
+
+        :param resource_group_name: The name of the resource group that contains the resource. You can
+         obtain this value from the Azure Resource Manager API or the portal.
+        :type resource_group_name: str
+        :param managed_instance_name: The name of the managed instance.
+        :type managed_instance_name: str
+        :param certificates: The server trust certificate info to upload, keyed by certificate name.
+        :type certificates: Mapping[str, ~azure.mgmt.sql.models.ServerTrustCertificate]
+        :keyword int max_concurrency: Maximum number of operations in flight. Default value is 16.
+        :return: The final ServerTrustCertificate, or the exception raised, keyed by certificate name.
+        :rtype: dict[str, ~azure.mgmt.sql.models.ServerTrustCertificate or Exception]
+        :raises ValueError: If ``max_concurrency`` is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _create_or_update(certificate_name, parameters):
+            async with semaphore:
+                poller = await self.begin_create_or_update(
+                    resource_group_name, managed_instance_name, certificate_name, parameters, **kwargs
+                )
+                return await poller.result()
+
+        names = list(certificates)
+        results = await asyncio.gather(
+            *(_create_or_update(name, certificates[name]) for name in names), return_exceptions=True
+        )
+        return dict(zip(names, results))
+
+    @distributed_trace_async
+    async def bulk_delete(
+        self,
+        resource_group_name: str,
+        managed_instance_name: str,
+        certificate_names: Iterable[str],
+        *,
+        max_concurrency: int = 16,
+        **kwargs: Any
+    ) -> Dict[str, Union[None, Exception]]:
+        """Deletes several server trust certificates from Sql Managed Instance concurrently.
+
+        Each certificate is deleted with its own long running operation, at most ``max_concurrency``
+        at a time. Operations are not ordered relative to each other, and a failure does not cancel
+        the remaining deletions.
+
+        :param resource_group_name: The name of the resource group that contains the resource. You can
+         obtain this value from the Azure Resource Manager API or the portal.
+        :type resource_group_name: str
+        :param managed_instance_name: The name of the managed instance.
+        :type managed_instance_name: str
+        :param certificate_names: Names of the certificates to delete. Duplicate names are deleted once.
+        :type certificate_names: Iterable[str]
+        :keyword int max_concurrency: Maximum number of operations in flight. Default value is 16.
+        :return: None, or the exception raised, keyed by certificate name.
+        :rtype: dict[str, None or Exception]
+        :raises ValueError: If ``max_concurrency`` is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _delete(certificate_name):
+            async with semaphore:
+                poller = await self.begin_delete(
+                    resource_group_name, managed_instance_name, certificate_name, **kwargs
+                )
+                return await poller.result()
+
+        names = list(dict.fromkeys(certificate_names))
+        results = await asyncio.gather(*(_delete(name) for name in names), return_exceptions=True)
+        return dict(zip(names, results))
+
+
+__all__: List[str] = ["ServerTrustCertificatesOperations"]  # Add all objects you want publicly available to users at this package level
 
 def patch_sdk():
     """Do not remove from this file.
@@ -0,0 +1,127 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import asyncio
+from unittest import mock
+
+import pytest
+
+from azure.core.exceptions import HttpResponseError
+from azure.mgmt.sql.aio.operations import ServerTrustCertificatesOperations
+
+RESOURCE_GROUP = "rg"
+MANAGED_INSTANCE = "mi"
+
+
+class _Poller:
+    def __init__(self, result):
+        self._result = result
+
+    async def result(self):
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
+
+
+class _ConcurrencyTracker:
+    """Fake begin_* method recording the peak number of operations in flight."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, resource_group_name, managed_instance_name, certificate_name, *args, **kwargs):
+        self.calls.append(certificate_name)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        return _Poller(self.outcomes[certificate_name])
+
+
+def _operations():
+    return ServerTrustCertificatesOperations(mock.Mock(), mock.Mock(), mock.Mock(), mock.Mock())
+
+
+class TestServerTrustCertificatesBulkAsync:
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_or_update_keys_results_by_name(self):
+        operations = _operations()
+        outcomes = {"cert1": "result1", "cert2": "result2"}
+        fake = _ConcurrencyTracker(outcomes)
+        with mock.patch.object(operations, "begin_create_or_update", fake):
+            results = await operations.bulk_create_or_update(
+                RESOURCE_GROUP, MANAGED_INSTANCE, {"cert1": "params1", "cert2": "params2"}
+            )
+        assert results == outcomes
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_or_update_captures_exceptions_per_name(self):
+        operations = _operations()
+        error = HttpResponseError(message="conflict")
+        fake = _ConcurrencyTracker({"ok": "result", "bad": error})
+        with mock.patch.object(operations, "begin_create_or_update", fake):
+            results = await operations.bulk_create_or_update(
+                RESOURCE_GROUP, MANAGED_INSTANCE, {"ok": "params", "bad": "params"}
+            )
+        assert results["ok"] == "result"
+        assert results["bad"] is error
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_or_update_caps_in_flight_operations(self):
+        operations = _operations()
+        names = ["cert{}".format(i) for i in range(10)]
+        fake = _ConcurrencyTracker({name: name for name in names})
+        with mock.patch.object(operations, "begin_create_or_update", fake):
+            results = await operations.bulk_create_or_update(
+                RESOURCE_GROUP, MANAGED_INSTANCE, {name: "params" for name in names}, max_concurrency=3
+            )
+        assert len(results) == 10
+        assert fake.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_keys_results_by_name(self):
+        operations = _operations()
+        error = HttpResponseError(message="not found")
+        fake = _ConcurrencyTracker({"cert1": None, "cert2": error})
+        with mock.patch.object(operations, "begin_delete", fake):
+            results = await operations.bulk_delete(RESOURCE_GROUP, MANAGED_INSTANCE, ["cert1", "cert2"])
+        assert results == {"cert1": None, "cert2": error}
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_deletes_duplicate_names_once(self):
+        operations = _operations()
+        fake = _ConcurrencyTracker({"cert1": None, "cert2": None})
+        with mock.patch.object(operations, "begin_delete", fake):
+            results = await operations.bulk_delete(RESOURCE_GROUP, MANAGED_INSTANCE, ["cert1", "cert2", "cert1"])
+        assert sorted(fake.calls) == ["cert1", "cert2"]
+        assert results == {"cert1": None, "cert2": None}
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_caps_in_flight_operations(self):
+        operations = _operations()
+        names = ["cert{}".format(i) for i in range(10)]
+        fake = _ConcurrencyTracker({name: None for name in names})
+        with mock.patch.object(operations, "begin_delete", fake):
+            await operations.bulk_delete(RESOURCE_GROUP, MANAGED_INSTANCE, names, max_concurrency=4)
+        assert fake.peak == 4
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    async def test_bulk_operations_reject_invalid_max_concurrency(self, max_concurrency):
+        operations = _operations()
+        with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+            await operations.bulk_create_or_update(
+                RESOURCE_GROUP, MANAGED_INSTANCE, {"cert1": "params"}, max_concurrency=max_concurrency
+            )
+        with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+            await operations.bulk_delete(RESOURCE_GROUP, MANAGED_INSTANCE, ["cert1"], max_concurrency=max_concurrency)
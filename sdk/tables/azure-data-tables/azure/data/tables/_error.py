@@ -17,19 +17,9 @@ from azure.core.exceptions import (
 )
 from azure.core.pipeline.policies import ContentDecodePolicy
 
-if sys.version_info < (3,):
-
-    def _str(value):
-        if isinstance(value, unicode):  # pylint: disable=undefined-variable
-            return value.encode("utf-8")
-
-        return str(value)
-else:
-    _str = str
-
 
 def _to_str(value):
-    return _str(value) if value is not None else None
+    return str(value) if value is not None else None
 
 
 _ERROR_TYPE_NOT_SUPPORTED = "Type not supported when sending data to the service: {0}."
@@ -38,19 +28,8 @@ _ERROR_UNKNOWN = "Unknown error ({0})"
 _ERROR_VALUE_NONE = "{0} should not be None."
 _ERROR_UNKNOWN_KEY_WRAP_ALGORITHM = "Unknown key wrap algorithm."
 
-# Storage table validation regex breakdown:
-# ^ Match start of string.
-# [a-zA-Z]{1} Match any letter for exactly 1 character.
-# [a-zA-Z0-9]{2,62} Match any alphanumeric character for between 2 and 62 characters.
-# $ End of string
-_STORAGE_VALID_TABLE = re.compile(r"^[a-zA-Z]{1}[a-zA-Z0-9]{2,62}$")
-
-# Cosmos table validation regex breakdown:
-# ^ Match start of string.
-# [^/\#?]{0,254} Match any character that is not /\#? for between 0-253 characters.
-# [^ /\#?]{1} Match any character that is not /\#? or a space for exactly 1 character.
-# $ End of string
-_COSMOS_VALID_TABLE = re.compile(r"^[^/\\#?]{0,253}[^ /\\#?]{1}$")
+# Deletes the characters Cosmos does not allow in table names: /, \, # and ?.
+_COSMOS_FORBIDDEN_TRANSLATION = str.maketrans("", "", "/\\#?")
 
 def _validate_not_none(param_name, param):
     if param is None:
@@ -58,75 +37,83 @@ def _validate_not_none(param_name, param):
 
 
 def _wrap_exception(ex, desired_type):
-    msg = ""
-    if len(ex.args) > 0:
-        msg = ex.args[0]
-    if sys.version_info >= (3,):
-        # Automatic chaining in Python 3 means we keep the trace
-        return desired_type(msg)
-
-    # There isn't a good solution in 2 for keeping the stack trace
-    # in general, or that will not result in an error in 3
-    # However, we can keep the previous error type and message
-    # TODO: In the future we will log the trace
-    return desired_type("{}: {}".format(ex.__class__.__name__, msg))
+    # Automatic exception chaining keeps the original trace
+    msg = ex.args[0] if ex.args else ""
+    return desired_type(msg)
 
 
 def _validate_storage_tablename(table_name):
-    if _STORAGE_VALID_TABLE.match(table_name) is None:
+    # Storage table names are 3-63 ASCII alphanumeric characters, starting with a letter.
+    if not (
+        3 <= len(table_name) <= 63
+        and table_name.isascii()
+        and table_name.isalnum()
+        and table_name[0].isalpha()
+    ):
         raise ValueError(
             "Storage table names must be alphanumeric, cannot begin with a number, and must be between 3-63 characters long."  # pylint: disable=line-too-long
         )
 
 
 def _validate_cosmos_tablename(table_name):
-    if _COSMOS_VALID_TABLE.match(table_name) is None:
+    if (
+        not 1 <= len(table_name) <= 254
+        or table_name.endswith(" ")
+        or len(table_name.translate(_COSMOS_FORBIDDEN_TRANSLATION)) != len(table_name)
+    ):
         raise ValueError(
             "Cosmos table names must contain from 1-255 characters, and they cannot contain /, \\, #, ?, or a trailing space."  # pylint: disable=line-too-long
         )
 
 
+# Service errors that may be caused by an invalid table name, keyed by error code. Each entry holds a
+# pattern matching the relevant error messages and the validator that produces a descriptive error.
+_TABLENAME_ERROR_PATTERNS = {
+    # Raised by Storage for any table/entity operations where the table name contains forbidden characters.
+    'InvalidResourceName': (
+        re.compile(r"The specifi?ed resource name contains invalid characters"),
+        _validate_storage_tablename,
+    ),
+    # Raised by Storage for any table/entity operations where the table name is < 3 or > 63 characters long.
+    'OutOfRangeInput': (
+        re.compile(r"The specified resource name length is not within the permissible limits"),
+        _validate_storage_tablename,
+    ),
+    # Raised by Cosmos during create_table if the table name contains forbidden characters or ends in a space.
+    'InternalServerError': (
+        re.compile(r"The resource name presented contains invalid character|The resource name can't end with space"),
+        _validate_cosmos_tablename,
+    ),
+    # Raised by Cosmos specifically during create_table if the table name is 255 or more characters.
+    # Entity operations on a too-long-table name simply result in a ResourceNotFoundError.
+    'BadRequest': (
+        re.compile(r"The input name is invalid\."),
+        _validate_cosmos_tablename,
+    ),
+    # Raised by Cosmos for any entity operations or delete_table if the table name contains forbidden
+    # characters (except in the case of trailing space and backslash).
+    'InvalidInput': (
+        re.compile(
+            r"Request url is invalid\.|One of the input values is invalid\."
+            r"|The table name contains an invalid character|Table name cannot end with a space\."
+        ),
+        _validate_cosmos_tablename,
+    ),
+    # Raised by Cosmos specifically on entity operations where the table name contains some forbidden
+    # characters, and seems to be a bug in the service authentication.
+    'Unauthorized': (
+        re.compile(
+            r"The input authorization token can't serve the request\.|The MAC signature found in the HTTP request"
+        ),
+        _validate_cosmos_tablename,
+    ),
+}
+
+
 def _validate_tablename_error(decoded_error, table_name):
-    if (decoded_error.error_code == 'InvalidResourceName' and
-        'The specified resource name contains invalid characters' in decoded_error.message):
-        # This error is raised by Storage for any table/entity operations where the table name contains
-        # forbidden characters.
-        _validate_storage_tablename(table_name)
-    elif (decoded_error.error_code == 'InvalidResourceName' and
-        'The specifed resource name contains invalid characters' in decoded_error.message):
-        # This error is raised by Storage for any table/entity operations where the table name contains
-        # forbidden characters.
-        _validate_storage_tablename(table_name)
-    elif (decoded_error.error_code == 'OutOfRangeInput' and
-          'The specified resource name length is not within the permissible limits' in decoded_error.message):
-        # This error is raised by Storage for any table/entity operations where the table name is < 3 or > 63
-        # characters long
-        _validate_storage_tablename(table_name)
-    elif (decoded_error.error_code == 'InternalServerError' and
-          ('The resource name presented contains invalid character' in decoded_error.message or
-           'The resource name can\'t end with space'in decoded_error.message)):
-        # This error is raised by Cosmos during create_table if the table name contains forbidden
-        # characters or ends in a space.
-        _validate_cosmos_tablename(table_name)
-    elif (decoded_error.error_code == 'BadRequest' and
-          'The input name is invalid.' in decoded_error.message):
-        # This error is raised by Cosmos specifically during create_table if the table name is 255 or more
-        # characters. Entity operations on a too-long-table name simply result in a ResourceNotFoundError.
-        _validate_cosmos_tablename(table_name)
-    elif (decoded_error.error_code == 'InvalidInput' and
-          ('Request url is invalid.' in decoded_error.message or
-           'One of the input values is invalid.' in decoded_error.message or
-           'The table name contains an invalid character' in decoded_error.message or
-           'Table name cannot end with a space.' in decoded_error.message)):
-        # This error is raised by Cosmos for any entity operations or delete_table if the table name contains
-        # forbidden characters (except in the case of trailing space and backslash).
-        _validate_cosmos_tablename(table_name)
-    elif (decoded_error.error_code == 'Unauthorized' and
-          ('The input authorization token can\'t serve the request.' in decoded_error.message or
-           'The MAC signature found in the HTTP request' in decoded_error.message)):
-        # This error is raised by Cosmos specifically on entity operations where the table name contains
-        # some forbidden characters, and seems to be a bug in the service authentication.
-        _validate_cosmos_tablename(table_name)
+    entry = _TABLENAME_ERROR_PATTERNS.get(decoded_error.error_code)
+    if entry and entry[0].search(decoded_error.message):
+        entry[1](table_name)
 
 
 def _decode_error(response, error_message=None, error_type=None, **kwargs):  # pylint: disable=too-many-branches
@@ -135,65 +122,42 @@ def _decode_error(response, error_message=None, error_type=None, **kwargs):  # p
     try:
         error_body = ContentDecodePolicy.deserialize_from_http_generics(response)
         if isinstance(error_body, dict):
-            for info in error_body.get("odata.error", {}):
-                if info == "code":
-                    error_code = error_body["odata.error"][info]
-                elif info == "message":
-                    error_message = error_body["odata.error"][info]["value"]
-                else:
-                    additional_data[info.tag] = info.text
+            odata_error = error_body.get("odata.error") or {}
+            error_code = odata_error.get("code", error_code)
+            odata_message = odata_error.get("message")
+            if isinstance(odata_message, dict):
+                error_message = odata_message.get("value", error_message)
         else:
             if error_body:
                 for info in error_body.iter():
-                    if info.tag.lower().find("code") != -1:
+                    tag = info.tag.lower()
+                    if "code" in tag:
                         error_code = info.text
-                    elif info.tag.lower().find("message") != -1:
+                    elif "message" in tag:
                         error_message = info.text
                     else:
                         additional_data[info.tag] = info.text
     except DecodeError:
         pass
 
-    try:
-        if not error_type:
-            error_code = TableErrorCode(error_code)
-            if error_code in [
-                TableErrorCode.condition_not_met,
-                TableErrorCode.update_condition_not_satisfied
-            ]:
-                error_type = ResourceModifiedError
-            elif error_code in [
-                TableErrorCode.invalid_authentication_info,
-                TableErrorCode.authentication_failed,
-            ]:
-                error_type = ClientAuthenticationError
-            elif error_code in [
-                TableErrorCode.resource_not_found,
-                TableErrorCode.table_not_found,
-                TableErrorCode.entity_not_found,
-                ResourceNotFoundError,
-            ]:
-                error_type = ResourceNotFoundError
-            elif error_code in [
-                TableErrorCode.resource_already_exists,
-                TableErrorCode.table_already_exists,
-                TableErrorCode.account_already_exists,
-                TableErrorCode.entity_already_exists,
-                ResourceExistsError,
-            ]:
-                error_type = ResourceExistsError
-            else:
-                error_type = HttpResponseError
-    except ValueError:
-        # Got an unknown error code
-        error_type = HttpResponseError
+    if not error_type:
+        # Unknown codes are kept as the raw string.
+        error_code = _CODE_TO_ENUM.get(error_code, error_code)
+        if error_code in _MODIFIED_CODES:
+            error_type = ResourceModifiedError
+        elif error_code in _AUTH_CODES:
+            error_type = ClientAuthenticationError
+        elif error_code in _NOT_FOUND_CODES:
+            error_type = ResourceNotFoundError
+        elif error_code in _EXISTS_CODES:
+            error_type = ResourceExistsError
+        else:
+            error_type = HttpResponseError
 
-    try:
-        error_message += "\nErrorCode:{}".format(error_code.value)
-    except AttributeError:
-        error_message += "\nErrorCode:{}".format(error_code)
+    message_parts = [error_message, "\nErrorCode:", str(getattr(error_code, "value", error_code))]
     for name, info in additional_data.items():
-        error_message += "\n{}:{}".format(name, info)
+        message_parts.extend(("\n", str(name), ":", str(info)))
+    error_message = "".join(message_parts)
 
     error = error_type(message=error_message, response=response, **kwargs)
     error.error_code = error_code
@@ -203,18 +167,14 @@ def _decode_error(response, error_message=None, error_type=None, **kwargs):  # p
 
 def _reraise_error(decoded_error):
     _, _, exc_traceback = sys.exc_info()
-    try:
-        raise decoded_error.with_traceback(exc_traceback)
-    except AttributeError:
-        decoded_error.__traceback__ = exc_traceback
-        raise decoded_error
+    raise decoded_error.with_traceback(exc_traceback)
 
 
 def _process_table_error(storage_error, table_name=None):
-    try:
-        decoded_error = _decode_error(storage_error.response, storage_error.message)
-    except AttributeError:
+    response = getattr(storage_error, "response", None)
+    if response is None:
         raise storage_error
+    decoded_error = _decode_error(response, getattr(storage_error, "message", None))
     if table_name:
         _validate_tablename_error(decoded_error, table_name)
     _reraise_error(decoded_error)
@@ -236,11 +196,9 @@ class TableTransactionError(HttpResponseError):
         self.index = kwargs.get('index', self._extract_index())
 
     def _extract_index(self):
-        try:
-            message_sections = self.message.split(':', 1)
-            return int(message_sections[0])
-        except:  # pylint: disable=bare-except
-            return 0
+        # Transaction error messages are prefixed with the failed operation's index, e.g. "1:<message>".
+        prefix = (self.message or "").partition(':')[0]
+        return int(prefix) if prefix.isdecimal() else 0
 
 
 class RequestTooLargeError(TableTransactionError):
@@ -316,3 +274,25 @@ class TableErrorCode(str, Enum): # pylint: disable=enum-must-inherit-case-insens
     x_method_incorrect_count = "XMethodIncorrectCount"
     x_method_incorrect_value = "XMethodIncorrectValue"
     x_method_not_using_post = "XMethodNotUsingPost"
+
+
+_CODE_TO_ENUM = {code.value: code for code in TableErrorCode}
+_MODIFIED_CODES = frozenset([
+    TableErrorCode.condition_not_met,
+    TableErrorCode.update_condition_not_satisfied,
+])
+_AUTH_CODES = frozenset([
+    TableErrorCode.invalid_authentication_info,
+    TableErrorCode.authentication_failed,
+])
+_NOT_FOUND_CODES = frozenset([
+    TableErrorCode.resource_not_found,
+    TableErrorCode.table_not_found,
+    TableErrorCode.entity_not_found,
+])
+_EXISTS_CODES = frozenset([
+    TableErrorCode.resource_already_exists,
+    TableErrorCode.table_already_exists,
+    TableErrorCode.account_already_exists,
+    TableErrorCode.entity_already_exists,
+])
@@ -4,15 +4,17 @@
 # license information.
 # --------------------------------------------------------------------------
 from multiprocessing.sharedctypes import Value # cspell:disable-line
+import json
 import pytest
 import platform
 
 from devtools_testutils import AzureRecordedTestCase, recorded_by_proxy
 
-from azure.data.tables._error import _validate_storage_tablename
+from azure.data.tables._error import _decode_error, _validate_storage_tablename
 from azure.data.tables import TableServiceClient, TableClient, TableTransactionError
 from azure.data.tables import __version__ as VERSION
 from azure.core.credentials import AzureNamedKeyCredential, AzureSasCredential
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
 
 from _shared.testcase import (
     TableTestCase
@@ -649,3 +651,42 @@ class TestTableUnitTests(TableTestCase):
             _validate_storage_tablename("a aa")
         with pytest.raises(ValueError):
             _validate_storage_tablename("1aaa")
+
+    def test_decode_error_with_odata_innererror(self):
+        response = _JsonErrorResponse(404, {
+            "odata.error": {
+                "code": "TableNotFound",
+                "message": {"lang": "en-US", "value": "The table specified does not exist."},
+                "innererror": {"message": "details", "type": "TableNotFound"},
+            }
+        })
+        error = _decode_error(response, "Operation returned an invalid status 'Not Found'")
+        assert isinstance(error, ResourceNotFoundError)
+        assert error.error_code == "TableNotFound"
+        assert error.message.startswith("The table specified does not exist.")
+        assert "ErrorCode:TableNotFound" in error.message
+
+    def test_decode_error_with_odata_message_without_value(self):
+        response = _JsonErrorResponse(400, {
+            "odata.error": {
+                "code": "SomeUnknownCode",
+                "message": {"lang": "en-US"},
+            }
+        })
+        error = _decode_error(response, "Operation returned an invalid status 'Bad Request'")
+        assert type(error) is HttpResponseError
+        assert error.error_code == "SomeUnknownCode"
+        assert error.message.startswith("Operation returned an invalid status 'Bad Request'")
+        assert "ErrorCode:SomeUnknownCode" in error.message
+
+
+class _JsonErrorResponse(object):
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.reason = "Error"
+        self.headers = {}
+        self.content_type = "application/json;odata=minimalmetadata"
+        self._body = json.dumps(body)
+
+    def text(self, encoding=None):
+        return self._body